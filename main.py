@@ -1,27 +1,67 @@
 import sys
-import requests
 import json
-import pytz
-from datetime import datetime
+from datetime import datetime, timezone, tzinfo
 import argparse
 import time
 import sqlite3
 from dataclasses import dataclass, asdict
-from typing import Dict, Optional, List, Tuple
+from contextlib import contextmanager
+from typing import Dict, Optional, List, Tuple, TYPE_CHECKING
+from functools import cached_property, lru_cache
 import os
 from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import importlib.util
 import math
 from enum import Enum
-import hashlib
-import urllib3
+from types import MappingProxyType
+import threading
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Disable SSL warnings for clean output
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fixed layouts built from fields directly, skipping strftime's locale handling
+def _fmt_clock(dt: datetime) -> str:
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+def _fmt_datetime(dt: datetime) -> str:
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {_fmt_clock(dt)}"
+
+def _fmt_utc(dt: datetime) -> str:
+    return f"{_fmt_datetime(dt)} UTC"
+
+# OpenWeather descriptions come from a small fixed vocabulary
+@lru_cache(maxsize=128)
+def _titlecase(text: str) -> str:
+    return text.title()
+
+# worldtimeapi responses only contribute this one field
+_DATETIME_RE = re.compile(rb'"datetime"\s*:\s*"([^"]+)"')
+
+# orjson when installed, stdlib json otherwise; both work on bytes, which
+# also lets API bodies skip requests' charset detection
+def _json_loads(content: bytes):
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
 
 class DataSource(Enum):
     CACHE = "cache"
     API = "api"
     FALLBACK = "fallback"
+    CLOCK = "clock"
 
 @dataclass
 class TemporalData:
@@ -46,8 +86,34 @@ class CityConfig:
     display_name: str
     coordinates: Tuple[float, float]
     weather_api_id: Optional[str] = None
+    
+    # Resolved on first use: zoneinfo needs a system tz database or the tzdata
+    # package, and a missing one must not break import or --help
+    @cached_property
+    def tz(self) -> tzinfo:
+        return ZoneInfo(self.timezone)
 
 class ResourceManager:
+    # Same SQL text on every call, so the connection's statement cache reuses the compiled plan.
+    # Inserts name their columns so caches created with the old hash column still accept writes.
+    _SQL_STORE_TEMPORAL = """
+        INSERT OR REPLACE INTO temporal_data (city, time_str, timestamp, source)
+        VALUES (?, ?, ?, ?)
+    """
+    _SQL_RETRIEVE_TEMPORAL = """
+        SELECT city, time_str, timestamp, source FROM temporal_data
+        WHERE city = ? AND timestamp > ?
+    """
+    _SQL_STORE_ATMOSPHERIC = """
+        INSERT OR REPLACE INTO atmospheric_data
+            (city, temperature, condition, humidity, wind_speed, timestamp, source)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    _SQL_RETRIEVE_ATMOSPHERIC = """
+        SELECT city, temperature, condition, humidity, wind_speed, timestamp, source
+        FROM atmospheric_data WHERE city = ? AND timestamp > ?
+    """
+    
     def __init__(self):
         self.base_path = Path.home() / ".worldmatrix"
         self.base_path.mkdir(exist_ok=True, parents=True)
@@ -56,9 +122,68 @@ class ResourceManager:
         self.weather_db = self.base_path / "atmospheric.db"
         self.config_file = self.base_path / "config.json"
         
+        self._time_lock = threading.Lock()
+        self._weather_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: Optional[Tuple[List[TemporalData], List[AtmosphericData]]] = None
+        # In-process front cache over SQLite, keyed by city id. Entries carry a
+        # time.monotonic() stamp so wall-clock jumps cannot expire or pin them;
+        # SQLite rows keep wall-clock timestamps since they outlive the process.
+        self._temporal_mem: Dict[str, Tuple[TemporalData, float]] = {}
+        self._atmos_mem: Dict[str, Tuple[AtmosphericData, float]] = {}
+        self.open_databases()
+        self.load_configuration()
+    
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        # Autocommit + WAL: writes append to the log instead of fsyncing a rollback journal
+        conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA mmap_size=30000000000;
+            PRAGMA busy_timeout=5000;
+        """)
+        return conn
+    
+    def open_databases(self):
+        self._time_conn = self._connect(self.time_db)
+        self._weather_conn = self._connect(self.weather_db)
         self.init_temporal_db()
         self.init_atmospheric_db()
-        self.load_configuration()
+    
+    def close(self):
+        with self._time_lock:
+            self._time_conn.close()
+        with self._weather_lock:
+            self._weather_conn.close()
+    
+    @contextmanager
+    def batch(self):
+        # Buffer stores made inside the block and flush them with one
+        # executemany per database, so no write lock is held during network I/O
+        with self._pending_lock:
+            self._pending = ([], [])
+        try:
+            yield
+        finally:
+            with self._pending_lock:
+                temporal, atmospheric = self._pending
+                self._pending = None
+            self.store_temporal_batch(temporal)
+            self.store_atmospheric_batch(atmospheric)
+    
+    def clear_cache(self):
+        self._temporal_mem.clear()
+        self._atmos_mem.clear()
+        self.close()
+        for db_path in (self.time_db, self.weather_db):
+            for suffix in ("", "-wal", "-shm"):
+                path = db_path.with_name(db_path.name + suffix)
+                if path.exists():
+                    path.unlink()
+        self.open_databases()
     
     def load_configuration(self):
         default_config = {
@@ -71,8 +196,8 @@ class ResourceManager:
         
         if self.config_file.exists():
             try:
-                with open(self.config_file) as f:
-                    self.config = {**default_config, **json.load(f)}
+                with open(self.config_file, 'rb') as f:
+                    self.config = {**default_config, **_json_loads(f.read())}
             except json.JSONDecodeError:
                 self.config = default_config
         else:
@@ -80,24 +205,23 @@ class ResourceManager:
             self.save_configuration()
     
     def save_configuration(self):
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        with open(self.config_file, 'wb') as f:
+            f.write(_json_dumps(self.config))
     
     def init_temporal_db(self):
-        with sqlite3.connect(self.time_db) as conn:
-            conn.execute("""
+        with self._time_lock:
+            self._time_conn.execute("""
                 CREATE TABLE IF NOT EXISTS temporal_data (
                     city TEXT PRIMARY KEY,
                     time_str TEXT,
                     timestamp REAL,
-                    source TEXT,
-                    hash TEXT
+                    source TEXT
                 )
             """)
     
     def init_atmospheric_db(self):
-        with sqlite3.connect(self.weather_db) as conn:
-            conn.execute("""
+        with self._weather_lock:
+            self._weather_conn.execute("""
                 CREATE TABLE IF NOT EXISTS atmospheric_data (
                     city TEXT PRIMARY KEY,
                     temperature REAL,
@@ -105,51 +229,94 @@ class ResourceManager:
                     humidity INTEGER,
                     wind_speed REAL,
                     timestamp REAL,
-                    source TEXT,
-                    hash TEXT
+                    source TEXT
                 )
             """)
     
+    def _write_many(self, conn: sqlite3.Connection, lock: threading.Lock, sql: str, rows: List[tuple]):
+        if not rows:
+            return
+        with lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(sql, rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
+    def store_temporal_batch(self, items: List[TemporalData]):
+        rows = [(d.city, d.time_str, d.timestamp, d.source.value) for d in items]
+        self._write_many(self._time_conn, self._time_lock, self._SQL_STORE_TEMPORAL, rows)
+    
+    def store_atmospheric_batch(self, items: List[AtmosphericData]):
+        rows = [(d.city, d.temperature, d.condition, d.humidity,
+                 d.wind_speed, d.timestamp, d.source.value) for d in items]
+        self._write_many(self._weather_conn, self._weather_lock, self._SQL_STORE_ATMOSPHERIC, rows)
+    
     def store_temporal(self, data: TemporalData):
-        data_hash = hashlib.md5(f"{data.time_str}{data.timestamp}".encode()).hexdigest()
-        with sqlite3.connect(self.time_db) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO temporal_data VALUES (?, ?, ?, ?, ?)
-            """, (data.city, data.time_str, data.timestamp, data.source.value, data_hash))
-    
-    def retrieve_temporal(self, city: str, ttl: int) -> Optional[TemporalData]:
-        cutoff = time.time() - ttl
-        with sqlite3.connect(self.time_db) as conn:
-            row = conn.execute("""
-                SELECT * FROM temporal_data WHERE city = ? AND timestamp > ?
-            """, (city, cutoff)).fetchone()
+        self._temporal_mem[data.city] = (data, time.monotonic() - max(0.0, time.time() - data.timestamp))
+        with self._pending_lock:
+            if self._pending is not None:
+                self._pending[0].append(data)
+                return
+        with self._time_lock:
+            self._time_conn.execute(self._SQL_STORE_TEMPORAL, (
+                data.city, data.time_str, data.timestamp, data.source.value))
+    
+    def retrieve_temporal(self, city: str, ttl: int, now: Optional[float] = None) -> Optional[TemporalData]:
+        entry = self._temporal_mem.get(city)
+        if entry is not None:
+            # The memory entry mirrors the newest row, so once it expires on the
+            # monotonic clock the row has too, whatever the wall clock says
+            return entry[0] if time.monotonic() - entry[1] < ttl else None
+        
+        if now is None:
+            now = time.time()
+        cutoff = now - ttl
+        
+        with self._time_lock:
+            row = self._time_conn.execute(self._SQL_RETRIEVE_TEMPORAL, (city, cutoff)).fetchone()
         
         if row:
-            return TemporalData(
+            data = TemporalData(
                 city=row[0],
                 time_str=row[1],
                 timestamp=row[2],
                 source=DataSource(row[3])
             )
+            # Carry the row's age over to the monotonic clock
+            self._temporal_mem[city] = (data, time.monotonic() - max(0.0, now - data.timestamp))
+            return data
         return None
     
     def store_atmospheric(self, data: AtmosphericData):
-        data_hash = hashlib.md5(f"{data.temperature}{data.condition}{data.timestamp}".encode()).hexdigest()
-        with sqlite3.connect(self.weather_db) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO atmospheric_data VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (data.city, data.temperature, data.condition, data.humidity, 
-                  data.wind_speed, data.timestamp, data.source.value, data_hash))
-    
-    def retrieve_atmospheric(self, city: str, ttl: int) -> Optional[AtmosphericData]:
-        cutoff = time.time() - ttl
-        with sqlite3.connect(self.weather_db) as conn:
-            row = conn.execute("""
-                SELECT * FROM atmospheric_data WHERE city = ? AND timestamp > ?
-            """, (city, cutoff)).fetchone()
+        self._atmos_mem[data.city] = (data, time.monotonic() - max(0.0, time.time() - data.timestamp))
+        with self._pending_lock:
+            if self._pending is not None:
+                self._pending[1].append(data)
+                return
+        with self._weather_lock:
+            self._weather_conn.execute(self._SQL_STORE_ATMOSPHERIC, (
+                data.city, data.temperature, data.condition, data.humidity,
+                data.wind_speed, data.timestamp, data.source.value))
+    
+    def retrieve_atmospheric(self, city: str, ttl: int, now: Optional[float] = None) -> Optional[AtmosphericData]:
+        entry = self._atmos_mem.get(city)
+        if entry is not None:
+            # The memory entry mirrors the newest row, so once it expires on the
+            # monotonic clock the row has too, whatever the wall clock says
+            return entry[0] if time.monotonic() - entry[1] < ttl else None
+        
+        if now is None:
+            now = time.time()
+        cutoff = now - ttl
+        
+        with self._weather_lock:
+            row = self._weather_conn.execute(self._SQL_RETRIEVE_ATMOSPHERIC, (city, cutoff)).fetchone()
         
         if row:
-            return AtmosphericData(
+            data = AtmosphericData(
                 city=row[0],
                 temperature=row[1],
                 condition=row[2],
@@ -158,6 +325,9 @@ class ResourceManager:
                 timestamp=row[5],
                 source=DataSource(row[6])
             )
+            # Carry the row's age over to the monotonic clock
+            self._atmos_mem[city] = (data, time.monotonic() - max(0.0, now - data.timestamp))
+            return data
         return None
 
 class TemporalAcquisition:
@@ -182,29 +352,42 @@ class TemporalAcquisition:
         )
     }
     
-    def __init__(self, resource_mgr: ResourceManager):
+    # (city_id, config) pairs in display order, for hot loops that need both
+    CITY_ITEMS = tuple(CITIES.items())
+    
+    def __init__(self, resource_mgr: ResourceManager, session: "requests.Session"):
         self.resource_mgr = resource_mgr
-        self.session = requests.Session()
-        self.session.timeout = 5
+        self.session = session
     
-    def acquire_temporal(self, city_id: str) -> TemporalData:
-        config = self.CITIES[city_id]
-        cached = self.resource_mgr.retrieve_temporal(city_id, 
-                    self.resource_mgr.config["cache_ttl"])
-        if cached:
-            return cached
+    def acquire_temporal(self, city_id: str, now: Optional[float] = None) -> TemporalData:
+        if now is None:
+            now = time.time()
+        offline = self.acquire_temporal_offline(city_id, now)
+        if offline:
+            return offline
+        return self.acquire_temporal_online(city_id, now)
+    
+    def acquire_temporal_offline(self, city_id: str, now: float) -> Optional[TemporalData]:
+        # Without a worldtimeapi key the OS clock gives the same wall time, with no
+        # network round-trip and no cached (and therefore stale) time string
+        if not self.resource_mgr.config["worldtimeapi_key"]:
+            return self._acquire_fallback(city_id, self.CITIES[city_id], now, DataSource.CLOCK)
         
-        api_time = self._acquire_from_worldtimeapi(city_id, config)
+        return self.resource_mgr.retrieve_temporal(city_id, 
+                    self.resource_mgr.config["cache_ttl"], now)
+    
+    def acquire_temporal_online(self, city_id: str, now: float) -> TemporalData:
+        config = self.CITIES[city_id]
+        api_time = self._acquire_from_worldtimeapi(city_id, config, now)
         if api_time:
             self.resource_mgr.store_temporal(api_time)
             return api_time
         
-        fallback_time = self._acquire_fallback(config)
-        fallback_time.city = city_id  # Ensure correct city ID
+        fallback_time = self._acquire_fallback(city_id, config, now)
         self.resource_mgr.store_temporal(fallback_time)
         return fallback_time
     
-    def _acquire_from_worldtimeapi(self, city_id: str, config: CityConfig) -> Optional[TemporalData]:
+    def _acquire_from_worldtimeapi(self, city_id: str, config: CityConfig, now: float) -> Optional[TemporalData]:
         try:
             api_key = self.resource_mgr.config["worldtimeapi_key"]
             base_url = "http://worldtimeapi.org/api/timezone"
@@ -214,16 +397,17 @@ class TemporalAcquisition:
             
             response = self.session.get(url, timeout=3)
             if response.status_code == 200:
-                data = response.json()
-                dt_str = data['datetime'].replace('Z', '+00:00')
+                match = _DATETIME_RE.search(response.content)
+                if match is None:
+                    return None
+                dt_str = match.group(1).decode().replace('Z', '+00:00')
                 dt = datetime.fromisoformat(dt_str)
-                tz = pytz.timezone(config.timezone)
-                localized = dt.astimezone(tz)
+                localized = dt.astimezone(config.tz)
                 
                 return TemporalData(
                     city=city_id,
-                    time_str=localized.strftime("%Y-%m-%d %H:%M:%S %Z"),
-                    timestamp=time.time(),
+                    time_str=f"{_fmt_datetime(localized)} {localized.tzname()}",
+                    timestamp=now,
                     source=DataSource.API
                 )
         except Exception as e:
@@ -231,45 +415,66 @@ class TemporalAcquisition:
             pass
         return None
     
-    def _acquire_fallback(self, config: CityConfig) -> TemporalData:
-        tz = pytz.timezone(config.timezone)
-        now = datetime.now(tz)
+    def _acquire_fallback(self, city_id: str, config: CityConfig, now: float,
+                          source: DataSource = DataSource.FALLBACK) -> TemporalData:
+        local = datetime.fromtimestamp(now, config.tz)
         
         return TemporalData(
-            city=config.timezone.split('/')[-1].lower().replace('_', ''),
-            time_str=now.strftime("%Y-%m-%d %H:%M:%S %Z%z"),
-            timestamp=time.time(),
-            source=DataSource.FALLBACK
+            city=city_id,
+            time_str=local.strftime("%Y-%m-%d %H:%M:%S %Z%z"),
+            timestamp=now,
+            source=source
         )
 
 class AtmosphericAcquisition:
-    def __init__(self, resource_mgr: ResourceManager):
+    # Fallback model tables, built once rather than on every generated reading
+    _BASE_TEMPS = MappingProxyType({
+        "london": 10,
+        "tokyo": 16,
+        "newyork": 12
+    })
+    # Indexed by month (1-12) and hour (0-23)
+    _SEASONAL_VARIATION = tuple(math.sin((month - 1) * math.pi / 6) * 8 for month in range(13))
+    _DAILY_VARIATION = tuple(math.sin((hour - 12) * math.pi / 12) * 3 for hour in range(24))
+    _WINTER_CONDITIONS = ("Clear", "Partly Cloudy", "Cloudy", "Light Snow")
+    _CONDITIONS = ("Clear", "Partly Cloudy", "Cloudy", "Light Rain")
+    
+    def __init__(self, resource_mgr: ResourceManager, session: "requests.Session"):
         self.resource_mgr = resource_mgr
-        self.session = requests.Session()
-        self.session.timeout = 5
+        self.session = session
+    
+    def acquire_atmospheric(self, city_id: str, now: Optional[float] = None) -> AtmosphericData:
+        if now is None:
+            now = time.time()
+        offline = self.acquire_atmospheric_offline(city_id, now)
+        if offline:
+            return offline
+        return self.acquire_atmospheric_online(city_id, now)
     
-    def acquire_atmospheric(self, city_id: str) -> AtmosphericData:
+    def acquire_atmospheric_offline(self, city_id: str, now: float) -> Optional[AtmosphericData]:
         cached = self.resource_mgr.retrieve_atmospheric(city_id, 
-                    self.resource_mgr.config["cache_ttl"])
+                    self.resource_mgr.config["cache_ttl"], now)
         if cached:
             return cached
         
-        config = TemporalAcquisition.CITIES[city_id]
         api_key = self.resource_mgr.config["openweather_api_key"]
-        
         if not api_key or api_key.strip() == "":
-            return self._generate_fallback_data(city_id, config)
-        
-        weather_data = self._acquire_from_openweather(config, api_key)
+            return self._generate_fallback_data(city_id, TemporalAcquisition.CITIES[city_id], now)
+        return None
+    
+    def acquire_atmospheric_online(self, city_id: str, now: float) -> AtmosphericData:
+        config = TemporalAcquisition.CITIES[city_id]
+        api_key = self.resource_mgr.config["openweather_api_key"]
+        weather_data = self._acquire_from_openweather(city_id, config, api_key, now)
         if weather_data:
             self.resource_mgr.store_atmospheric(weather_data)
             return weather_data
         
-        fallback = self._generate_fallback_data(city_id, config)
+        fallback = self._generate_fallback_data(city_id, config, now)
         self.resource_mgr.store_atmospheric(fallback)
         return fallback
     
-    def _acquire_from_openweather(self, config: CityConfig, api_key: str) -> Optional[AtmosphericData]:
+    def _acquire_from_openweather(self, city_id: str, config: CityConfig, api_key: str, now: float) -> Optional[AtmosphericData]:
         try:
             base_url = "https://api.openweathermap.org/data/2.5/weather"
             units = self.resource_mgr.config.get('units', 'metric')
@@ -291,15 +496,15 @@ class AtmosphericAcquisition:
             
             response = self.session.get(base_url, params=params, timeout=3)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 
                 return AtmosphericData(
-                    city=config.display_name,
+                    city=city_id,
                     temperature=data['main']['temp'],
-                    condition=data['weather'][0]['description'].title(),
+                    condition=_titlecase(data['weather'][0]['description']),
                     humidity=data['main']['humidity'],
                     wind_speed=data['wind']['speed'],
-                    timestamp=time.time(),
+                    timestamp=now,
                     source=DataSource.API
                 )
         except Exception as e:
@@ -307,36 +512,16 @@ class AtmosphericAcquisition:
             pass
         return None
     
-    def _generate_fallback_data(self, city_id: str, config: CityConfig) -> AtmosphericData:
-        tz = pytz.timezone(config.timezone)
-        now = datetime.now(tz)
-        month = now.month
-        hour = now.hour
-        
-        # Base temperatures by city
-        base_temps = {
-            "london": 10,
-            "tokyo": 16,
-            "newyork": 12
-        }
+    def _generate_fallback_data(self, city_id: str, config: CityConfig, now: float) -> AtmosphericData:
+        local = datetime.fromtimestamp(now, config.tz)
+        month = local.month
+        hour = local.hour
         
-        base_temp = base_temps.get(city_id, 15)
-        
-        # Seasonal variation
-        temp_variation = math.sin((month - 1) * math.pi / 6) * 8
-        # Daily variation
-        hour_variation = math.sin((hour - 12) * math.pi / 12) * 3
-        
-        temperature = base_temp + temp_variation + hour_variation
+        base_temp = self._BASE_TEMPS.get(city_id, 15)
+        temperature = base_temp + self._SEASONAL_VARIATION[month] + self._DAILY_VARIATION[hour]
         
         # Conditions based on month and hour
-        if month in [12, 1, 2]:
-            conditions = ["Clear", "Partly Cloudy", "Cloudy", "Light Snow"]
-        elif month in [6, 7, 8]:
-            conditions = ["Clear", "Partly Cloudy", "Cloudy", "Light Rain"]
-        else:
-            conditions = ["Clear", "Partly Cloudy", "Cloudy", "Light Rain"]
-        
+        conditions = self._WINTER_CONDITIONS if month in (12, 1, 2) else self._CONDITIONS
         condition = conditions[(month + hour) % 4]
         
         # Convert to imperial if configured
@@ -348,83 +533,85 @@ class AtmosphericAcquisition:
             wind_speed = 3.5 + (month % 3)
         
         return AtmosphericData(
-            city=config.display_name,
+            city=city_id,
             temperature=round(temperature, 1),
             condition=condition,
             humidity=65 + (month * 2) % 20,
             wind_speed=round(wind_speed, 1),
-            timestamp=time.time(),
+            timestamp=now,
             source=DataSource.FALLBACK
         )
 
 class DisplayEngine:
+    _SOURCE_SYMBOL = MappingProxyType({
+        DataSource.CACHE: "⚡",
+        DataSource.API: "📡",
+        DataSource.FALLBACK: "🔄",
+        DataSource.CLOCK: "🕐"
+    })
+    
+    _CARD_BORDER = "═" * 40
+    _CARD_TEMPLATE = "\n".join([
+        "╔" + _CARD_BORDER + "╗",
+        "║ {display_name:38} ║",
+        "╠" + _CARD_BORDER + "╣",
+        "║ Time:    {time_display:28} ║",
+        "║ Weather: {weather_display:28} ║",
+        "║          {humidity_display:28} ║",
+        "║          {wind_display:28} ║",
+        "║          " + "-" * 28 + " ║",
+        "║ Zone:    {timezone:28} ║",
+        "║ Source:  {source_display:28} ║",
+        "╚" + _CARD_BORDER + "╝"
+    ])
+    
+    _MATRIX_HEADERS = ("City", "Time", "Temp", "Condition", "Humidity", "Wind", "Source")
+    
     @staticmethod
-    def generate_city_matrix(temporal: TemporalData, atmospheric: AtmosphericData, 
-                           config: CityConfig) -> str:
+    def unit_labels(units: str) -> Tuple[str, str]:
+        if units == 'metric':
+            return "°C", "m/s"
+        return "°F", "mph"
+    
+    @classmethod
+    def generate_city_matrix(cls, temporal: TemporalData, atmospheric: AtmosphericData, 
+                           config: CityConfig, units: str = "metric") -> str:
         time_parts = temporal.time_str.split()
         time_display = f"{time_parts[1]} {time_parts[2] if len(time_parts) > 2 else ''}"
         
-        units = os.getenv('UNITS', 'metric')
-        if units == 'metric':
-            temp_unit = "°C"
-            wind_unit = "m/s"
-        else:
-            temp_unit = "°F"
-            wind_unit = "mph"
-        
-        weather_display = f"{atmospheric.temperature:.1f}{temp_unit} | {atmospheric.condition}"
-        humidity_display = f"Humidity: {atmospheric.humidity}%"
-        wind_display = f"Wind: {atmospheric.wind_speed:.1f}{wind_unit}"
-        
-        source_symbol = {
-            DataSource.CACHE: "⚡",
-            DataSource.API: "📡",
-            DataSource.FALLBACK: "🔄"
-        }
-        
-        symbol = source_symbol.get(temporal.source, "❓")
-        source_display = f"{symbol} {temporal.source.value}"
-        
-        width = 42
-        border = "═" * (width - 2)
+        temp_unit, wind_unit = cls.unit_labels(units)
         
-        lines = []
-        lines.append(f"╔{border}╗")
-        lines.append(f"║ {config.display_name:38} ║")
-        lines.append(f"╠{border}╣")
-        lines.append(f"║ Time:    {time_display:28} ║")
-        lines.append(f"║ Weather: {weather_display:28} ║")
-        lines.append(f"║          {humidity_display:28} ║")
-        lines.append(f"║          {wind_display:28} ║")
-        lines.append(f"║          {'-'*28} ║")
-        lines.append(f"║ Zone:    {config.timezone:28} ║")
-        lines.append(f"║ Source:  {source_display:28} ║")
-        lines.append(f"╚{border}╝")
+        symbol = cls._SOURCE_SYMBOL.get(temporal.source, "❓")
         
-        return "\n".join(lines)
+        return cls._CARD_TEMPLATE.format(
+            display_name=config.display_name,
+            time_display=time_display,
+            weather_display=f"{atmospheric.temperature:.1f}{temp_unit} | {atmospheric.condition}",
+            humidity_display=f"Humidity: {atmospheric.humidity}%",
+            wind_display=f"Wind: {atmospheric.wind_speed:.1f}{wind_unit}",
+            timezone=config.timezone,
+            source_display=f"{symbol} {temporal.source.value}"
+        )
     
-    @staticmethod
-    def generate_comparative_matrix(city_data: Dict[str, Tuple[TemporalData, AtmosphericData]]):
-        headers = ["City", "Time", "Temp", "Condition", "Humidity", "Wind", "Source"]
+    @classmethod
+    def generate_comparative_matrix(cls, city_data: Dict[str, Tuple[TemporalData, AtmosphericData]],
+                                    units: str = "metric"):
+        headers = cls._MATRIX_HEADERS
         rows = []
         
-        units = os.getenv('UNITS', 'metric')
-        temp_unit = "°C" if units == 'metric' else "°F"
-        wind_unit = "m/s" if units == 'metric' else "mph"
+        temp_unit, wind_unit = cls.unit_labels(units)
         
-        for city_id, (temp, atmos) in city_data.items():
-            config = TemporalAcquisition.CITIES[city_id]
+        for city_id, config in TemporalAcquisition.CITY_ITEMS:
+            if city_id not in city_data:
+                continue
+            temp, atmos = city_data[city_id]
             time_parts = temp.time_str.split()
             time_short = f"{time_parts[1]}"
             if len(time_parts) > 2:
                 tz_short = time_parts[2][:3] if len(time_parts[2]) > 2 else time_parts[2]
                 time_short += f" {tz_short}"
             
-            source_symbol = {
-                DataSource.CACHE: "⚡",
-                DataSource.API: "📡",
-                DataSource.FALLBACK: "🔄"
-            }.get(temp.source, "❓")
+            source_symbol = cls._SOURCE_SYMBOL.get(temp.source, "❓")
             
             condition_short = atmos.condition[:10] if len(atmos.condition) > 10 else atmos.condition
             
@@ -438,8 +625,8 @@ class DisplayEngine:
                 source_symbol
             ])
         
-        col_widths = [max(len(str(row[i])) for row in [headers] + rows) + 2 
-                     for i in range(len(headers))]
+        # Every cell is already a str; measure each column in a single pass
+        col_widths = [max(map(len, column)) + 2 for column in zip(headers, *rows)]
         
         def create_row(items, widths):
             return "│" + "│".join(f" {item:<{width-2}} " for item, width in zip(items, widths)) + "│"
@@ -455,15 +642,70 @@ class DisplayEngine:
         return "\n".join(matrix)
 
 class CommandInterface:
+    # Clear screen and home cursor without spawning a shell
+    CLEAR_SCREEN = "\x1b[2J\x1b[H"
+    # Later frames repaint in place: home the cursor, then erase each line's
+    # leftover tail and anything below the new frame
+    CURSOR_HOME = "\x1b[H"
+    ERASE_LINE_TAIL = "\x1b[K"
+    ERASE_BELOW = "\x1b[J"
+    WATCH_RULE = "─" * 60
+    
+    # Static part of each city's --raw entry; "time" and "weather" are filled per cycle
+    RAW_CITY_TEMPLATES = tuple(
+        (city_id, {
+            "display_name": config.display_name,
+            "time": None,
+            "weather": None,
+            "coordinates": config.coordinates,
+            "timezone": config.timezone
+        })
+        for city_id, config in TemporalAcquisition.CITY_ITEMS
+    )
+    
     def __init__(self):
-        self.resource_mgr = ResourceManager()
-        self.temporal_engine = TemporalAcquisition(self.resource_mgr)
-        self.atmospheric_engine = AtmosphericAcquisition(self.resource_mgr)
         self.display_engine = DisplayEngine()
-        self.setup_parser()
+        # One worker per (city, kind) acquisition, so a cycle fans out fully
+        self.executor = ThreadPoolExecutor(max_workers=2 * len(TemporalAcquisition.CITIES))
+        self.interrupted = False
+    
+    # Heavy members are built on first use so --help never touches the network stack or disk
+    @cached_property
+    def resource_mgr(self) -> ResourceManager:
+        return ResourceManager()
+    
+    @cached_property
+    def session(self) -> "requests.Session":
+        import requests
+        import urllib3
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        # Disable SSL warnings for clean output
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        
+        # One pooled session shared by both engines; keep-alive survives across cycles
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
     
-    def setup_parser(self):
-        self.parser = argparse.ArgumentParser(
+    @cached_property
+    def temporal_engine(self) -> TemporalAcquisition:
+        return TemporalAcquisition(self.resource_mgr, self.session)
+    
+    @cached_property
+    def atmospheric_engine(self) -> AtmosphericAcquisition:
+        return AtmosphericAcquisition(self.resource_mgr, self.session)
+    
+    @cached_property
+    def parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser(
             prog="matrix",
             description="Temporal-Atmospheric Surveillance System",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -484,7 +726,7 @@ Operational Protocols:
             """
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             "--city",
             choices=["london", "tokyo", "newyork", "all"],
             default="all",
@@ -492,44 +734,44 @@ Operational Protocols:
             help="Target city specification"
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             "--watch",
             action="store_true",
             help="Activate continuous surveillance"
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             "--compare",
             action="store_true",
             help="Generate comparative analysis matrix"
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             "--raw",
             action="store_true",
             help="Output unformatted JSON data"
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             "--config",
             action="store_true",
             help="Display system configuration"
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             "--set-key",
             nargs=2,
             metavar=("TYPE", "KEY"),
             help="Configure API key (types: openweather, worldtime)"
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             "--units",
             choices=["metric", "imperial"],
             help="Set measurement units"
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             "--refresh",
             type=int,
             default=10,
@@ -537,11 +779,13 @@ Operational Protocols:
             help="Surveillance refresh interval"
         )
         
-        self.parser.add_argument(
+        parser.add_argument(
             "--clear-cache",
             action="store_true",
             help="Purge cached data"
         )
+        
+        return parser
     
     def execute_configuration(self, args):
         if args.set_key:
@@ -556,18 +800,14 @@ Operational Protocols:
         
         if args.units:
             self.resource_mgr.config["units"] = args.units
-            os.environ['UNITS'] = args.units
             self.resource_mgr.save_configuration()
+            # Cached readings were converted with the previous units
+            self.resource_mgr.clear_cache()
             print(f"Units set to {args.units}")
             return
         
         if args.clear_cache:
-            if self.resource_mgr.time_db.exists():
-                self.resource_mgr.time_db.unlink()
-            if self.resource_mgr.weather_db.exists():
-                self.resource_mgr.weather_db.unlink()
-            self.resource_mgr.init_temporal_db()
-            self.resource_mgr.init_atmospheric_db()
+            self.resource_mgr.clear_cache()
             print("Cache purged")
             return
         
@@ -582,16 +822,19 @@ Operational Protocols:
     
     def generate_raw_data(self, city_data):
         data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             "system": "temporal-atmospheric-matrix",
             "units": self.resource_mgr.config.get("units", "metric"),
             "data": {}
         }
         
-        for city_id, (temp, atmos) in city_data.items():
-            config = TemporalAcquisition.CITIES[city_id]
-            data["data"][city_id] = {
-                "display_name": config.display_name,
+        entries = data["data"]
+        for city_id, template in self.RAW_CITY_TEMPLATES:
+            if city_id not in city_data:
+                continue
+            temp, atmos = city_data[city_id]
+            entries[city_id] = {
+                **template,
                 "time": {
                     "value": temp.time_str,
                     "source": temp.source.value,
@@ -604,116 +847,202 @@ Operational Protocols:
                     "wind_speed": atmos.wind_speed,
                     "source": atmos.source.value,
                     "timestamp": atmos.timestamp
-                },
-                "coordinates": config.coordinates,
-                "timezone": config.timezone
+                }
             }
         
-        print(json.dumps(data, indent=2))
+        return _json_dumps(data).decode()
     
-    def execute_surveillance_cycle(self, args):
+    def acquire_city_data(self, city_ids, now: float) -> Tuple[Dict[str, Tuple[TemporalData, AtmosphericData]], Dict[str, Exception]]:
+        results = {}
+        errors = {}
+        
+        # Resolve what the clock and caches can answer inline; only acquisitions
+        # that need the network go to the pool. In --watch with a warm cache,
+        # a cycle therefore never leaves the main thread.
+        jobs = []
+        for city_id in city_ids:
+            try:
+                temp = self.temporal_engine.acquire_temporal_offline(city_id, now)
+                atmos = self.atmospheric_engine.acquire_atmospheric_offline(city_id, now)
+            except Exception as e:
+                errors[city_id] = e
+                continue
+            if temp is None:
+                jobs.append((city_id, "temporal", self.temporal_engine.acquire_temporal_online))
+            else:
+                results[(city_id, "temporal")] = temp
+            if atmos is None:
+                jobs.append((city_id, "atmospheric", self.atmospheric_engine.acquire_atmospheric_online))
+            else:
+                results[(city_id, "atmospheric")] = atmos
+        
+        if jobs:
+            with self.resource_mgr.batch():
+                futures = {self.executor.submit(acquire, city_id, now): (city_id, kind)
+                           for city_id, kind, acquire in jobs}
+                
+                for future in as_completed(futures):
+                    city_id, kind = futures[future]
+                    try:
+                        results[(city_id, kind)] = future.result()
+                    except Exception as e:
+                        errors.setdefault(city_id, e)
+        
+        # Rebuild in city order, completion order is arbitrary
+        city_data = {}
+        for city_id in city_ids:
+            if city_id not in errors:
+                city_data[city_id] = (results[(city_id, "temporal")], results[(city_id, "atmospheric")])
+        return city_data, errors
+    
+    def render_surveillance_cycle(self, args) -> str:
+        out = []
+        # One wall-clock read per cycle: fallback rows and SQLite cutoffs share this timestamp
+        now = time.time()
+        units = self.resource_mgr.config.get("units", "metric")
+        
         if args.compare:
-            city_data = {}
-            for city_id in TemporalAcquisition.CITIES:
-                try:
-                    temp = self.temporal_engine.acquire_temporal(city_id)
-                    atmos = self.atmospheric_engine.acquire_atmospheric(city_id)
-                    city_data[city_id] = (temp, atmos)
-                except Exception as e:
-                    print(f"Error acquiring data for {city_id}: {e}")
+            city_data, errors = self.acquire_city_data(TemporalAcquisition.CITIES, now)
+            for city_id, e in errors.items():
+                out.append(f"Error acquiring data for {city_id}: {e}")
             
             if args.raw:
-                self.generate_raw_data(city_data)
+                out.append(self.generate_raw_data(city_data))
             else:
-                matrix = self.display_engine.generate_comparative_matrix(city_data)
-                print(f"\nTemporal-Atmospheric Comparison Matrix")
-                print(f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-                print(matrix)
-            return
-        
-        if args.city == "all":
+                matrix = self.display_engine.generate_comparative_matrix(city_data, units)
+                out.append(f"\nTemporal-Atmospheric Comparison Matrix")
+                out.append(f"Generated: {_fmt_utc(datetime.now(timezone.utc))}")
+                out.append(matrix)
+        elif args.city == "all":
+            city_data, errors = self.acquire_city_data(TemporalAcquisition.CITIES, now)
             if args.raw:
-                city_data = {}
-                for city_id in TemporalAcquisition.CITIES:
-                    temp = self.temporal_engine.acquire_temporal(city_id)
-                    atmos = self.atmospheric_engine.acquire_atmospheric(city_id)
-                    city_data[city_id] = (temp, atmos)
-                self.generate_raw_data(city_data)
+                if errors:
+                    raise next(iter(errors.values()))
+                out.append(self.generate_raw_data(city_data))
             else:
-                for city_id in TemporalAcquisition.CITIES:
+                for city_id, config in TemporalAcquisition.CITY_ITEMS:
+                    if city_id in errors:
+                        out.append(f"Error displaying {city_id}: {errors[city_id]}")
+                        continue
                     try:
-                        temp = self.temporal_engine.acquire_temporal(city_id)
-                        atmos = self.atmospheric_engine.acquire_atmospheric(city_id)
-                        config = TemporalAcquisition.CITIES[city_id]
-                        matrix = self.display_engine.generate_city_matrix(temp, atmos, config)
-                        print(matrix + "\n")
+                        temp, atmos = city_data[city_id]
+                        matrix = self.display_engine.generate_city_matrix(temp, atmos, config, units)
+                        out.append(matrix + "\n")
                     except Exception as e:
-                        print(f"Error displaying {city_id}: {e}")
+                        out.append(f"Error displaying {city_id}: {e}")
         else:
             try:
-                temp = self.temporal_engine.acquire_temporal(args.city)
-                atmos = self.atmospheric_engine.acquire_atmospheric(args.city)
+                temp = self.temporal_engine.acquire_temporal(args.city, now)
+                atmos = self.atmospheric_engine.acquire_atmospheric(args.city, now)
                 config = TemporalAcquisition.CITIES[args.city]
                 
                 if args.raw:
-                    self.generate_raw_data({args.city: (temp, atmos)})
+                    out.append(self.generate_raw_data({args.city: (temp, atmos)}))
                 else:
-                    matrix = self.display_engine.generate_city_matrix(temp, atmos, config)
-                    print(matrix)
+                    out.append(self.display_engine.generate_city_matrix(temp, atmos, config, units))
             except Exception as e:
-                print(f"Error: {e}")
+                out.append(f"Error: {e}")
+        
+        return "\n".join(out) + "\n"
+    
+    def execute_surveillance_cycle(self, args):
+        sys.stdout.write(self.render_surveillance_cycle(args))
+    
+    @staticmethod
+    def enable_windows_vt():
+        # Let the Windows console interpret the ANSI sequences used by watch mode
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
     
     def execute_continuous_surveillance(self, args):
         try:
             interval = max(2, args.refresh)
             cycle = 0
             
+            if os.name == 'nt':
+                self.enable_windows_vt()
+            
+            # Frames bypass the text layer and go to the byte buffer in one write
+            sys.stdout.flush()
+            out = sys.stdout.buffer
+            encoding = sys.stdout.encoding or "utf-8"
+            errors = sys.stdout.errors or "strict"
+            
             while True:
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print(f"Temporal-Atmospheric Surveillance - Cycle {cycle}")
-                print(f"Refresh: {interval}s | {datetime.utcnow().strftime('%H:%M:%S UTC')}")
-                print("─" * 60 + "\n")
-                
-                self.execute_surveillance_cycle(args)
-                
-                print(f"\n{'─' * 60}")
-                print(f"Next update in {interval}s | Ctrl+C to terminate")
+                body = (
+                    f"Temporal-Atmospheric Surveillance - Cycle {cycle}\n"
+                    f"Refresh: {interval}s | {_fmt_clock(datetime.now(timezone.utc))} UTC\n"
+                    f"{self.WATCH_RULE}\n\n"
+                    f"{self.render_surveillance_cycle(args)}"
+                    f"\n{self.WATCH_RULE}\n"
+                    f"Next update in {interval}s | Ctrl+C to terminate\n"
+                )
+                prefix = self.CLEAR_SCREEN if cycle == 0 else self.CURSOR_HOME
+                frame = prefix + body.replace("\n", self.ERASE_LINE_TAIL + "\n") + self.ERASE_BELOW
+                out.write(frame.encode(encoding, errors))
+                out.flush()
                 time.sleep(interval)
                 cycle += 1
         except KeyboardInterrupt:
+            self.interrupted = True
             print("\nSurveillance terminated")
     
     def execute(self):
         args = self.parser.parse_args()
         
-        if args.config or args.set_key or args.units or args.clear_cache:
-            self.execute_configuration(args)
-            return
-        
-        if args.watch:
-            self.execute_continuous_surveillance(args)
-        else:
-            self.execute_surveillance_cycle(args)
+        try:
+            if args.config or args.set_key or args.units or args.clear_cache:
+                self.execute_configuration(args)
+                return
+            
+            # Resolve zones before dispatch so a missing tz database is reported once
+            _ = [config.tz for config in TemporalAcquisition.CITIES.values()]
+            
+            if args.watch:
+                self.execute_continuous_surveillance(args)
+            else:
+                self.execute_surveillance_cycle(args)
+        finally:
+            # Drop queued fetches before the connections their stores would use go away
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            # resource_mgr is lazy; only close it if something actually built it
+            if "resource_mgr" in self.__dict__:
+                self.resource_mgr.close()
 
 def main():
-    try:
-        import pytz
-    except ImportError:
+    # Probe without importing; requests is only loaded once a session is needed
+    if importlib.util.find_spec("requests") is None:
         print("Error: Required modules not installed.")
-        print("Please run: pip install pytz requests urllib3")
+        print("Please run: pip install requests urllib3 tzdata")
         sys.exit(1)
     
+    interrupted = False
     try:
         interface = CommandInterface()
         interface.execute()
+        interrupted = interface.interrupted
+    except ZoneInfoNotFoundError as e:
+        print(f"Error: {e}")
+        print("No time zone database found. Please run: pip install tzdata")
+        sys.exit(1)
     except KeyboardInterrupt:
         print("\nOperation terminated")
-        sys.exit(0)
+        interrupted = True
     except Exception as e:
         print(f"System error: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    
+    if interrupted:
+        # Pool workers are non-daemon, so a normal exit would wait out every
+        # in-flight request and its retries; the cache is already closed
+        sys.stdout.flush()
+        os._exit(0)
 
 if __name__ == "__main__":
     main()